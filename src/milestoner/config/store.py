@@ -1,11 +1,32 @@
-import json
 import os
+import stat
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 CONFIG_DIR = Path.home() / ".milestoner"
 CONFIG_FILE = CONFIG_DIR / "config.json"
-POST_HISTORY_FILE = CONFIG_DIR / "post-history.json"
+POST_HISTORY_FILE = CONFIG_DIR / "post-history.jsonl"
+LEGACY_POST_HISTORY_FILE = CONFIG_DIR / "post-history.json"
+
+
+def _env_flag(name: str) -> bool:
+    """Read a boolean environment variable; only 1/true/yes/on turn it on."""
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+# JSON is written compactly; set MILESTONER_PRETTY=1 to indent it for reading by hand
+PRETTY_JSON = _env_flag("MILESTONER_PRETTY")
+
+# Parsed JSON files keyed by path, tagged with the file version they were parsed from
+_CACHE: dict[Path, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
+# Writes deferred by an open config_transaction(), flushed when it exits
+_pending: dict[Path, dict[str, Any]] | None = None
 
 
 def _ensure_config_dir() -> None:
@@ -13,20 +34,139 @@ def _ensure_config_dir() -> None:
     CONFIG_DIR.mkdir(mode=0o700, exist_ok=True)
 
 
+def _file_version(path: Path) -> tuple[int, int, int] | None:
+    """Get a cheap change marker for a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 def _read_json(path: Path) -> dict[str, Any]:
     """Read a JSON file, returning empty dict if not found."""
-    if not path.exists():
+    if _pending is not None and path in _pending:
+        return _copy_json(_pending[path])
+
+    version = _file_version(path)
+    if version is None:
+        _CACHE.pop(path, None)
         return {}
-    with open(path) as f:
-        return json.load(f)
+
+    cached = _CACHE.get(path)
+    if cached is None or cached[0] != version:
+        with open(path, "rb") as f:
+            cached = (version, orjson.loads(f.read()))
+        _CACHE[path] = cached
+
+    # Hand out a copy so callers can mutate it without corrupting the cache
+    return _copy_json(cached[1])
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy parsed JSON data. Much cheaper than copy.deepcopy for plain dicts and lists."""
+    if type(value) is dict:
+        return {k: _copy_json(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_json(v) for v in value]
+    return value
 
 
 def _write_json(path: Path, data: dict[str, Any]) -> None:
     """Write data to JSON file with restricted permissions."""
+    if _pending is not None:
+        _pending[path] = data
+        return
+
     _ensure_config_dir()
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
-    os.chmod(path, 0o600)
+    _write_atomic(path, orjson.dumps(data, option=orjson.OPT_INDENT_2 if PRETTY_JSON else None))
+
+    # Remember what we just wrote so the next read doesn't reopen and reparse the file
+    _CACHE[path] = (_file_version(path), _copy_json(data))
+
+
+def _private_opener(path: str, flags: int) -> int:
+    """Open a file readable only by the owner, for use as open(..., opener=...)."""
+    fd = os.open(path, flags, 0o600)
+    # The mode only applies to newly created files; fix up pre-existing ones
+    if stat.S_IMODE(os.fstat(fd).st_mode) != 0o600:
+        os.fchmod(fd, 0o600)
+    return fd
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Replace a file's contents atomically with restricted permissions.
+
+    Writes to a temporary file created with mode 600, syncs it, then renames
+    it over the target, so a crash leaves either the old or the new file.
+    """
+    # A unique temp name, so concurrent writers (e.g. two server processes) don't
+    # clobber each other's temp file. mkstemp creates it with mode 600.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+    # Persist the rename itself
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _read_jsonl(path: Path) -> list[dict[str, Any]]:
+    """Read a JSON-lines file, returning an empty list if not found."""
+    try:
+        with open(path, "rb") as f:
+            return [orjson.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def _append_jsonl(path: Path, records: list[dict[str, Any]]) -> int:
+    """
+    Append records to a JSON-lines file in a single write, without rewriting it.
+
+    Returns the number of bytes written.
+    """
+    _ensure_config_dir()
+    payload = b"".join(orjson.dumps(r) + b"\n" for r in records)
+    with open(path, "ab", opener=_private_opener) as f:
+        f.write(payload)
+    return len(payload)
+
+
+@contextmanager
+def config_transaction() -> Iterator[None]:
+    """
+    Group several config mutations into a single write per file.
+
+    Reads inside the block see the pending changes. Nothing is written if the
+    block raises. Nested transactions join the outermost one.
+    """
+    global _pending
+
+    if _pending is not None:
+        yield
+        return
+
+    _pending = {}
+    try:
+        yield
+        pending = _pending
+    finally:
+        _pending = None
+
+    for path, data in pending.items():
+        _write_json(path, data)
 
 
 def get_config() -> dict[str, Any]:
@@ -69,16 +209,47 @@ def set_default_platform(platform: str) -> None:
     save_config(config)
 
 
+def _migrate_legacy_history() -> None:
+    """Convert a legacy post-history.json file into the JSONL history format."""
+    if not LEGACY_POST_HISTORY_FILE.exists():
+        return
+
+    posts = _read_json(LEGACY_POST_HISTORY_FILE).get("posts", [])
+    lines = b"".join(orjson.dumps(p) + b"\n" for p in posts)
+    if POST_HISTORY_FILE.exists():
+        lines += POST_HISTORY_FILE.read_bytes()
+
+    _write_atomic(POST_HISTORY_FILE, lines)
+    LEGACY_POST_HISTORY_FILE.unlink()
+
+
 def get_post_history() -> list[dict[str, Any]]:
     """Get the history of posts made through Milestoner."""
-    data = _read_json(POST_HISTORY_FILE)
-    return data.get("posts", [])
+    _migrate_legacy_history()
+    return _read_jsonl(POST_HISTORY_FILE)
+
+
+def get_post_history_json() -> str:
+    """Get the post history as a JSON array, joined from the stored lines without parsing them."""
+    _migrate_legacy_history()
+    try:
+        data = POST_HISTORY_FILE.read_bytes()
+    except FileNotFoundError:
+        return "[]"
+    # Split on "\n" only: str.splitlines() would also split on U+2028 and friends,
+    # which orjson writes unescaped inside strings
+    lines = [line for line in data.split(b"\n") if line.strip()]
+    return (b"[" + b",".join(lines) + b"]").decode()
 
 
 def add_post_to_history(post: dict[str, Any]) -> None:
     """Add a post to the history."""
-    data = _read_json(POST_HISTORY_FILE)
-    if "posts" not in data:
-        data["posts"] = []
-    data["posts"].append(post)
-    _write_json(POST_HISTORY_FILE, data)
+    add_posts_to_history([post])
+
+
+def add_posts_to_history(posts: list[dict[str, Any]]) -> None:
+    """Append posts to the history as JSON lines in a single write."""
+    if not posts:
+        return
+    _migrate_legacy_history()
+    _append_jsonl(POST_HISTORY_FILE, posts)
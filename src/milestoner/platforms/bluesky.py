@@ -1,11 +1,17 @@
 import re
+import threading
 from typing import Any
 
 from atproto import Client
 from atproto.exceptions import AtProtocolError
 
+from ..config.store import get_platform_credentials
 from .base import Platform
 
+# Shape checks run before contacting the server, so malformed credentials fail fast
+_HANDLE_RE = re.compile(r"^[a-z0-9][a-z0-9-]*(\.[a-z0-9-]+)+$", re.IGNORECASE)
+_APP_PASSWORD_RE = re.compile(r"^[a-z0-9]{4}(-[a-z0-9]{4}){3}$", re.IGNORECASE)
+
 
 def parse_facets(text: str) -> list[dict[str, Any]]:
     """Parse URLs and hashtags from text to create Bluesky facets."""
@@ -46,6 +52,10 @@ class BlueskyPlatform(Platform):
     def __init__(self) -> None:
         self._client: Client | None = None
         self._handle: str | None = None
+        self._app_password: str | None = None
+        # The instance is shared and called from worker threads, so logging in and
+        # posting are serialized. Reentrant because post() may log in on first use.
+        self._lock = threading.RLock()
 
     @property
     def name(self) -> str:
@@ -57,26 +67,50 @@ class BlueskyPlatform(Platform):
 
     def authenticate(self, credentials: dict[str, str]) -> bool:
         """Authenticate with Bluesky using handle and app password."""
-        handle = credentials.get("handle", "")
+        # Handles are often typed with a leading "@"
+        handle = credentials.get("handle", "").lstrip("@")
         app_password = credentials.get("app_password", "")
 
         if not handle or not app_password:
             return False
 
-        try:
-            self._client = Client()
-            self._client.login(handle, app_password)
-            self._handle = handle
-            return True
-        except AtProtocolError:
-            self._client = None
-            self._handle = None
+        # Skip the login round-trip for credentials that can't be valid. Emails and
+        # DIDs are accepted login identifiers too, so only plain handles are checked.
+        is_handle = "@" not in handle and not handle.startswith("did:")
+        if is_handle and not _HANDLE_RE.match(handle):
+            return False
+        if not _APP_PASSWORD_RE.match(app_password):
             return False
 
+        with self._lock:
+            # Already logged in with these credentials - reuse the session
+            if self._client and (handle, app_password) == (self._handle, self._app_password):
+                return True
+
+            try:
+                self._client = self._client or Client()
+                self._client.login(handle, app_password)
+                self._handle = handle
+                self._app_password = app_password
+                return True
+            except AtProtocolError:
+                self._client = None
+                self._handle = None
+                self._app_password = None
+                return False
+
     def post(self, content: str) -> dict[str, Any]:
         """Post content to Bluesky."""
+        with self._lock:
+            return self._send_post(content)
+
+    def _send_post(self, content: str) -> dict[str, Any]:
+        """Send a post, logging in first if needed. Call with the lock held."""
         if not self._client:
-            return {"success": False, "url": "", "error": "Not authenticated"}
+            # Log in with the saved credentials on first use
+            credentials = get_platform_credentials(self.name)
+            if not credentials or not self.authenticate(credentials):
+                return {"success": False, "url": "", "error": "Not authenticated"}
 
         if len(content) > self.character_limit:
             return {
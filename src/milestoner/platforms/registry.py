@@ -1,22 +1,41 @@
-from typing import Type
+import importlib
 
 from .base import Platform
-from .bluesky import BlueskyPlatform
 
-# Registry of available platforms
-PLATFORMS: dict[str, Type[Platform]] = {
-    "bluesky": BlueskyPlatform,
+# Registry of available platforms as (module, class name). Platform modules
+# pull in their SDKs, so they're only imported when first used.
+PLATFORMS: dict[str, tuple[str, str]] = {
+    "bluesky": (".bluesky", "BlueskyPlatform"),
 }
 
+_PLATFORM_NAMES = frozenset(PLATFORMS)
+
+# Platform instances, created on first use and shared for the life of the process
+_INSTANCES: dict[str, Platform] = {}
+
 
 def get_platform(name: str) -> Platform:
-    """Get a platform instance by name."""
+    """Get a platform instance by name. Instances (and their sessions) are reused."""
     if name not in PLATFORMS:
         available = ", ".join(PLATFORMS.keys())
         raise ValueError(f"Unknown platform: {name}. Available: {available}")
-    return PLATFORMS[name]()
+    if name not in _INSTANCES:
+        module_name, class_name = PLATFORMS[name]
+        module = importlib.import_module(module_name, __package__)
+        _INSTANCES[name] = getattr(module, class_name)()
+    return _INSTANCES[name]
+
+
+def invalidate_platform(name: str) -> None:
+    """Drop a cached platform instance, e.g. after its credentials are rotated."""
+    _INSTANCES.pop(name, None)
 
 
 def list_platforms() -> list[str]:
     """List all available platform names."""
     return list(PLATFORMS.keys())
+
+
+def list_platform_set() -> frozenset[str]:
+    """Get the available platform names as a set, for membership checks."""
+    return _PLATFORM_NAMES
@@ -1,6 +1,9 @@
 """Optimal posting time suggestions and scheduling utilities."""
 
-from datetime import datetime, timedelta
+from collections.abc import Iterator
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -20,6 +23,9 @@ OPTIMAL_TIMES = {
     6: [(11, 0, "Sunday late morning"), (15, 0, "Sunday afternoon")],  # Sunday
 }
 
+# Days from each weekday (Monday = 0) until the next Wednesday
+_DAYS_UNTIL_WEDNESDAY = tuple((2 - weekday) % 7 for weekday in range(7))
+
 # Times to avoid
 AVOID_TIMES = [
     (23, 6, "Late night to early morning - lowest engagement"),
@@ -27,6 +33,7 @@ AVOID_TIMES = [
 ]
 
 
+@lru_cache(maxsize=1)
 def get_user_timezone() -> ZoneInfo:
     """Get user's timezone. Defaults to US/Eastern."""
     # Could be enhanced to read from config
@@ -43,47 +50,15 @@ def get_optimal_times(timezone: ZoneInfo | None = None) -> dict[str, Any]:
     now = datetime.now(tz)
     today = now.weekday()
 
-    recommendations = []
-
-    # Check today's remaining optimal times
-    today_times = OPTIMAL_TIMES.get(today, [])
-    for hour, minute, desc in today_times:
-        optimal_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        if optimal_time > now:
-            recommendations.append(
-                {
-                    "datetime": optimal_time.isoformat(),
-                    "relative": "today",
-                    "time": optimal_time.strftime("%I:%M %p"),
-                    "day": optimal_time.strftime("%A"),
-                    "reason": desc,
-                    "priority": "high" if "peak" in desc.lower() else "medium",
-                }
-            )
-
-    # Add tomorrow's times
-    tomorrow = (today + 1) % 7
-    tomorrow_date = now + timedelta(days=1)
-    tomorrow_times = OPTIMAL_TIMES.get(tomorrow, [])
-    for hour, minute, desc in tomorrow_times:
-        optimal_time = tomorrow_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        recommendations.append(
-            {
-                "datetime": optimal_time.isoformat(),
-                "relative": "tomorrow",
-                "time": optimal_time.strftime("%I:%M %p"),
-                "day": optimal_time.strftime("%A"),
-                "reason": desc,
-                "priority": "high" if "peak" in desc.lower() else "medium",
-            }
-        )
+    # Top 5 upcoming times; later candidates are never built
+    recommendations = list(islice(_upcoming_times(now), 5))
 
     # Find next Wednesday 10 AM if not already included (best time overall)
-    days_until_wednesday = (2 - today) % 7
+    days_until_wednesday = _DAYS_UNTIL_WEDNESDAY[today]
     if days_until_wednesday == 0 and now.hour >= 10:
         days_until_wednesday = 7
-    next_wednesday = now + timedelta(days=days_until_wednesday)
-    next_wednesday_10am = next_wednesday.replace(hour=10, minute=0, second=0, microsecond=0)
+    next_wednesday = now.date() + timedelta(days=days_until_wednesday)
+    next_wednesday_10am = datetime.combine(next_wednesday, time(10, 0), tz)
 
     # Current time assessment
     current_quality = _assess_current_time(now)
@@ -92,7 +67,7 @@ def get_optimal_times(timezone: ZoneInfo | None = None) -> dict[str, Any]:
         "current_time": now.isoformat(),
         "timezone": str(tz),
         "current_time_quality": current_quality,
-        "recommendations": recommendations[:5],  # Top 5 upcoming times
+        "recommendations": recommendations,
         "best_time_this_week": {
             "datetime": next_wednesday_10am.isoformat(),
             "description": "Wednesday 10 AM - statistically the best time for engagement",
@@ -104,11 +79,31 @@ def get_optimal_times(timezone: ZoneInfo | None = None) -> dict[str, Any]:
     }
 
 
+def _upcoming_times(now: datetime) -> Iterator[dict[str, Any]]:
+    """Yield today's remaining optimal times, then tomorrow's, in order."""
+    today = now.date()
+    for relative, day in (("today", today), ("tomorrow", today + timedelta(days=1))):
+        for hour, minute, desc in OPTIMAL_TIMES.get(day.weekday(), []):
+            optimal_time = datetime.combine(day, time(hour, minute), now.tzinfo)
+            if optimal_time <= now:
+                continue
+            yield {
+                "datetime": optimal_time.isoformat(),
+                "relative": relative,
+                "time": optimal_time.strftime("%I:%M %p"),
+                "day": optimal_time.strftime("%A"),
+                "reason": desc,
+                "priority": "high" if "peak" in desc.lower() else "medium",
+            }
+
+
 def _assess_current_time(now: datetime) -> dict[str, Any]:
     """Assess if now is a good time to post."""
-    hour = now.hour
-    weekday = now.weekday()
+    return dict(_QUALITY_TABLE[now.weekday()][now.hour])
+
 
+def _assess_slot(weekday: int, hour: int) -> dict[str, Any]:
+    """Assess posting at a given hour on a given weekday."""
     # Check if it's a bad time
     for start, end, reason in AVOID_TIMES:
         if start <= hour < end:
@@ -139,6 +134,10 @@ def _assess_current_time(now: datetime) -> dict[str, Any]:
     }
 
 
+# Assessment for every hour of the week, indexed as [weekday][hour]
+_QUALITY_TABLE = [[_assess_slot(weekday, hour) for hour in range(24)] for weekday in range(7)]
+
+
 def suggest_posting_time(content_type: str = "general") -> dict[str, Any]:
     """
     Suggest the best time to post based on content type.
@@ -1,15 +1,21 @@
-import json
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import Resource, TextContent, Tool
+import orjson
 
-from .config.store import get_post_history
+from .config.store import (
+    CONFIG_FILE,
+    LEGACY_POST_HISTORY_FILE,
+    POST_HISTORY_FILE,
+    PRETTY_JSON,
+    _file_version,
+    get_post_history,
+    get_post_history_json,
+)
 from .platforms.registry import list_platforms
 from .scheduling import get_optimal_times
 from .tools.configure import configure, get_configuration_status
-from .tools.draft_update import draft_update
-from .tools.list_activity import list_activity
 from .tools.post_update import post_update
 from .tools.schedule_post import (
     cancel_scheduled_post,
@@ -17,12 +23,52 @@ from .tools.schedule_post import (
     schedule_post,
 )
 
-server = Server("milestoner")
+# The MCP SDK is slow to import, so it's only loaded when the server actually runs
+if TYPE_CHECKING:
+    from mcp.server import Server
+    from mcp.types import Resource, TextContent, Tool
+    from pydantic import AnyUrl
 
+# Created by _init_server()
+server: "Server | None" = None
+
+# Platforms are registered statically, so their names are joined once for the tool descriptions
+_PLATFORM_NAMES = ", ".join(list_platforms())
+
+# Tool arguments for configure that aren't platform credentials
+_CONFIGURE_EXCLUDE = frozenset({"platform", "set_default"})
+
+# Serialized resources keyed by URI, tagged with the version of the files they were built from
+_resource_cache: dict[str, tuple[Any, str]] = {}
+
+
+def _dumps(data: Any, pretty: bool = PRETTY_JSON) -> str:
+    """Serialize a response with orjson, compact unless pretty output is requested."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None).decode()
+
+
+def _read_cached_resource(uri: str, version: Any, build: Callable[[], str]) -> str:
+    """Build a resource's text, reusing the last result while its backing files are unchanged."""
+    cached = _resource_cache.get(uri)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    text = build()
+    _resource_cache[uri] = (version, text)
+    return text
+
+
+def _recent_posts_json() -> str:
+    """Serialize the post history, splicing the stored JSON lines in directly unless pretty."""
+    if PRETTY_JSON:
+        return _dumps({"posts": get_post_history()})
+    return '{"posts":' + get_post_history_json() + "}"
+
+
+@lru_cache(maxsize=1)
+def _build_tools() -> list["Tool"]:
+    """Build the tool schemas. Platforms are registered statically, so this runs once."""
+    from mcp.types import Tool
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available tools."""
     return [
         Tool(
             name="list_activity",
@@ -68,7 +114,7 @@ async def handle_list_tools() -> list[Tool]:
                     },
                     "platform": {
                         "type": "string",
-                        "description": f"Target platform ({', '.join(list_platforms())})",
+                        "description": f"Target platform ({_PLATFORM_NAMES})",
                     },
                 },
             },
@@ -85,7 +131,7 @@ async def handle_list_tools() -> list[Tool]:
                     },
                     "platform": {
                         "type": "string",
-                        "description": f"Target platform ({', '.join(list_platforms())})",
+                        "description": f"Target platform ({_PLATFORM_NAMES})",
                     },
                 },
                 "required": ["content"],
@@ -99,7 +145,7 @@ async def handle_list_tools() -> list[Tool]:
                 "properties": {
                     "platform": {
                         "type": "string",
-                        "description": f"Platform to configure ({', '.join(list_platforms())})",
+                        "description": f"Platform to configure ({_PLATFORM_NAMES})",
                     },
                     "handle": {
                         "type": "string",
@@ -134,7 +180,7 @@ async def handle_list_tools() -> list[Tool]:
                     },
                     "platform": {
                         "type": "string",
-                        "description": f"Target platform ({', '.join(list_platforms())})",
+                        "description": f"Target platform ({_PLATFORM_NAMES})",
                     },
                     "use_optimal_time": {
                         "type": "boolean",
@@ -178,55 +224,102 @@ async def handle_list_tools() -> list[Tool]:
     ]
 
 
-@server.call_tool()
-async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
+async def handle_list_tools() -> list["Tool"]:
+    """List available tools."""
+    return _build_tools()
+
+
+async def _run_list_activity(arguments: dict) -> dict[str, Any]:
+    # The git tools pull in GitPython, so they're imported on first use
+    from .tools.list_activity import list_activity
+
+    return list_activity(
+        repo_path=arguments.get("repo_path"),
+        since=arguments.get("since", "7 days"),
+    )
+
+
+async def _run_draft_update(arguments: dict) -> dict[str, Any]:
+    from .tools.draft_update import draft_update
+
+    return draft_update(
+        context=arguments.get("context"),
+        style=arguments.get("style", "casual"),
+        repo_path=arguments.get("repo_path"),
+        commit_range=arguments.get("commit_range"),
+        platform=arguments.get("platform"),
+    )
+
+
+async def _run_post_update(arguments: dict) -> dict[str, Any]:
+    return await post_update(
+        content=arguments["content"],
+        platform=arguments.get("platform"),
+    )
+
+
+async def _run_configure(arguments: dict) -> dict[str, Any]:
+    # Extract credentials from arguments
+    platform = arguments["platform"]
+    set_default = arguments.get("set_default", True)
+    credentials = {k: v for k, v in arguments.items() if k not in _CONFIGURE_EXCLUDE}
+    return configure(platform=platform, set_default=set_default, **credentials)
+
+
+async def _run_schedule_post(arguments: dict) -> dict[str, Any]:
+    return schedule_post(
+        content=arguments["content"],
+        scheduled_for=arguments.get("scheduled_for"),
+        platform=arguments.get("platform"),
+        use_optimal_time=arguments.get("use_optimal_time", False),
+    )
+
+
+async def _run_list_scheduled_posts(arguments: dict) -> dict[str, Any]:
+    return list_scheduled_posts()
+
+
+async def _run_cancel_scheduled_post(arguments: dict) -> dict[str, Any]:
+    return cancel_scheduled_post(post_id=arguments["post_id"])
+
+
+async def _run_get_optimal_times(arguments: dict) -> dict[str, Any]:
+    return get_optimal_times()
+
+
+# Tool name -> adaptor that unpacks the call arguments and runs the tool
+_HANDLERS: dict[str, Callable[[dict], Awaitable[dict[str, Any]]]] = {
+    "list_activity": _run_list_activity,
+    "draft_update": _run_draft_update,
+    "post_update": _run_post_update,
+    "configure": _run_configure,
+    "schedule_post": _run_schedule_post,
+    "list_scheduled_posts": _run_list_scheduled_posts,
+    "cancel_scheduled_post": _run_cancel_scheduled_post,
+    "get_optimal_times": _run_get_optimal_times,
+}
+
+
+async def handle_call_tool(name: str, arguments: dict) -> list["TextContent"]:
     """Handle tool calls."""
-    if name == "list_activity":
-        result = list_activity(
-            repo_path=arguments.get("repo_path"),
-            since=arguments.get("since", "7 days"),
-        )
-    elif name == "draft_update":
-        result = draft_update(
-            context=arguments.get("context"),
-            style=arguments.get("style", "casual"),
-            repo_path=arguments.get("repo_path"),
-            commit_range=arguments.get("commit_range"),
-            platform=arguments.get("platform"),
-        )
-    elif name == "post_update":
-        result = post_update(
-            content=arguments["content"],
-            platform=arguments.get("platform"),
-        )
-    elif name == "configure":
-        # Extract credentials from arguments
-        platform = arguments["platform"]
-        set_default = arguments.get("set_default", True)
-        credentials = {k: v for k, v in arguments.items() if k not in ["platform", "set_default"]}
-        result = configure(platform=platform, set_default=set_default, **credentials)
-    elif name == "schedule_post":
-        result = schedule_post(
-            content=arguments["content"],
-            scheduled_for=arguments.get("scheduled_for"),
-            platform=arguments.get("platform"),
-            use_optimal_time=arguments.get("use_optimal_time", False),
-        )
-    elif name == "list_scheduled_posts":
-        result = list_scheduled_posts()
-    elif name == "cancel_scheduled_post":
-        result = cancel_scheduled_post(post_id=arguments["post_id"])
-    elif name == "get_optimal_times":
-        result = get_optimal_times()
-    else:
+    from mcp.types import TextContent
+
+    handler = _HANDLERS.get(name)
+    if handler is None:
         result = {"error": f"Unknown tool: {name}"}
+    else:
+        result = await handler(arguments)
 
-    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    # TextContent only takes str. Returning the dict instead would have the SDK add an
+    # indented json.dumps copy alongside structuredContent, so serialize it ourselves.
+    return [TextContent(type="text", text=_dumps(result))]
 
 
-@server.list_resources()
-async def handle_list_resources() -> list[Resource]:
-    """List available resources."""
+@lru_cache(maxsize=1)
+def _build_resources() -> list["Resource"]:
+    """Build the resource list, once."""
+    from mcp.types import Resource
+
     return [
         Resource(
             uri="milestoner://config",
@@ -243,23 +336,48 @@ async def handle_list_resources() -> list[Resource]:
     ]
 
 
-@server.read_resource()
-async def handle_read_resource(uri: str) -> str:
+async def handle_list_resources() -> list["Resource"]:
+    """List available resources."""
+    return _build_resources()
+
+
+async def handle_read_resource(uri: "AnyUrl | str") -> str:
     """Read a resource."""
+    # The SDK passes a pydantic AnyUrl, which never compares equal to a str
+    uri = str(uri)
     if uri == "milestoner://config":
-        status = get_configuration_status()
-        return json.dumps(status, indent=2)
+        return _read_cached_resource(
+            uri, _file_version(CONFIG_FILE), lambda: _dumps(get_configuration_status())
+        )
     elif uri == "milestoner://recent-posts":
-        history = get_post_history()
-        return json.dumps({"posts": history}, indent=2)
+        version = (_file_version(POST_HISTORY_FILE), _file_version(LEGACY_POST_HISTORY_FILE))
+        return _read_cached_resource(uri, version, _recent_posts_json)
     else:
-        return json.dumps({"error": f"Unknown resource: {uri}"})
+        return _dumps({"error": f"Unknown resource: {uri}"})
+
+
+def _init_server() -> "Server":
+    """Create the MCP server and register its handlers the first time it's needed."""
+    global server
+    if server is None:
+        from mcp.server import Server
+
+        server = Server("milestoner")
+        server.list_tools()(handle_list_tools)
+        server.call_tool()(handle_call_tool)
+        server.list_resources()(handle_list_resources)
+        server.read_resource()(handle_read_resource)
+    return server
 
 
 def main():
     """Run the MCP server."""
     import asyncio
 
+    from mcp.server.stdio import stdio_server
+
+    server = _init_server()
+
     async def run():
         async with stdio_server() as (read_stream, write_stream):
             await server.run(read_stream, write_stream, server.create_initialization_options())
@@ -1,7 +1,12 @@
 from typing import Any
 
-from ..config.store import get_config, save_platform_credentials, set_default_platform
-from ..platforms.registry import get_platform, list_platforms
+from ..config.store import (
+    config_transaction,
+    get_config,
+    save_platform_credentials,
+    set_default_platform,
+)
+from ..platforms.registry import get_platform, list_platform_set, list_platforms
 
 
 def configure(
@@ -21,7 +26,7 @@ def configure(
         Success/failure status with validation result
     """
     # Validate platform
-    if platform not in list_platforms():
+    if platform not in list_platform_set():
         return {
             "success": False,
             "error": f"Unknown platform: {platform}. Available: {', '.join(list_platforms())}",
@@ -47,12 +52,13 @@ def configure(
             "error": "Authentication failed. Please check your credentials.",
         }
 
-    # Save credentials
-    save_platform_credentials(platform, credentials)
+    # Save credentials and default together in a single config write
+    with config_transaction():
+        save_platform_credentials(platform, credentials)
 
-    # Set as default if requested
-    if set_default:
-        set_default_platform(platform)
+        # Set as default if requested
+        if set_default:
+            set_default_platform(platform)
 
     return {
         "success": True,
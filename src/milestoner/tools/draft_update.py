@@ -1,9 +1,31 @@
 from typing import Any
 
-from ..git.history import format_commits_for_display, get_activity_summary, get_commits
-from ..platforms.registry import get_platform, list_platforms
+from ..config.store import get_default_platform
+from ..git.history import (
+    format_commits_for_display,
+    get_activity_summary,
+    get_commits,
+    get_repo_metadata,
+)
+from ..platforms.registry import get_platform, list_platform_set, list_platforms
 from ..scheduling import get_optimal_times
 
+# Style guidance for the LLM
+_STYLE_GUIDANCE = {
+    "casual": "Friendly, conversational tone. Like talking to a friend about what you built.",
+    "announcement": "Professional but excited. Announcing a milestone or release.",
+    "technical": "Focus on the technical details. What was implemented, how it works.",
+    "storytelling": "Tell the journey. The problem, the struggle, the solution.",
+}
+
+_INSTRUCTIONS = (
+    "Generate a {platform} post ({limit} char max) based on this git activity. "
+    "Style: {style}. "
+    "User wants to highlight: {focus}. "
+    "Keep it authentic and avoid corporate speak. "
+    "Optionally suggest 1-2 relevant hashtags at the end."
+).format
+
 
 def draft_update(
     context: str | None = None,
@@ -30,12 +52,10 @@ def draft_update(
     """
     # Determine platform
     if platform is None:
-        from ..config.store import get_default_platform
-
         platform = get_default_platform()
 
     # Validate platform
-    if platform not in list_platforms():
+    if platform not in list_platform_set():
         return {
             "error": f"Unknown platform: {platform}. Available: {', '.join(list_platforms())}",
         }
@@ -51,20 +71,14 @@ def draft_update(
         else:
             # Default to recent commits
             commits = get_commits(repo_path=repo_path, since="7 days")
+        metadata = get_repo_metadata(repo_path)
     except ValueError as e:
         return {"error": str(e)}
 
-    formatted_commits = format_commits_for_display(commits)
+    # Only the 10 most recent commits are shown; the summary still covers the whole window
+    formatted_commits = format_commits_for_display(commits[:10])
     summary = get_activity_summary(commits)
 
-    # Style guidance for the LLM
-    style_guidance = {
-        "casual": "Friendly, conversational tone. Like talking to a friend about what you built.",
-        "announcement": "Professional but excited. Announcing a milestone or release.",
-        "technical": "Focus on the technical details. What was implemented, how it works.",
-        "storytelling": "Tell the journey. The problem, the struggle, the solution.",
-    }
-
     # Get optimal posting times
     optimal_times = get_optimal_times()
 
@@ -73,17 +87,18 @@ def draft_update(
         "character_limit": char_limit,
         "user_context": context,
         "style": style,
-        "style_guidance": style_guidance.get(style, style_guidance["casual"]),
+        "style_guidance": _STYLE_GUIDANCE.get(style, _STYLE_GUIDANCE["casual"]),
         "git_context": {
-            "commits": formatted_commits[:10],  # Limit to 10 most recent
+            # Only the repo identity; the origin URL itself stays out of the LLM's context
+            "repository": {"owner_repo": metadata["owner_repo"], "branch": metadata["branch"]},
+            "commits": formatted_commits,
             "summary": summary,
         },
         "optimal_posting": optimal_times,
-        "instructions": (
-            f"Generate a {platform} post ({char_limit} char max) based on this git activity. "
-            f"Style: {style}. "
-            f"User wants to highlight: {context or 'general progress'}. "
-            "Keep it authentic and avoid corporate speak. "
-            "Optionally suggest 1-2 relevant hashtags at the end."
+        "instructions": _INSTRUCTIONS(
+            platform=platform,
+            limit=char_limit,
+            style=style,
+            focus=context or "general progress",
         ),
     }
@@ -29,12 +29,9 @@ def list_activity(
 
     formatted = format_commits_for_display(commits)
     summary = get_activity_summary(commits)
-    grouped = group_commits_by_day(commits)
 
-    # Format grouped commits for display
-    grouped_formatted: dict[str, list[dict[str, Any]]] = {}
-    for date_key, day_commits in grouped.items():
-        grouped_formatted[date_key] = format_commits_for_display(day_commits)
+    # Group the already-formatted commits rather than formatting each day's commits again
+    grouped_formatted = group_commits_by_day(commits, formatted)
 
     return {
         "commits": formatted,
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from typing import Any
 
@@ -6,10 +7,10 @@ from ..config.store import (
     get_default_platform,
     get_platform_credentials,
 )
-from ..platforms.registry import get_platform, list_platforms
+from ..platforms.registry import get_platform, list_platform_set, list_platforms
 
 
-def post_update(
+async def post_update(
     content: str,
     platform: str | None = None,
 ) -> dict[str, Any]:
@@ -28,7 +29,7 @@ def post_update(
         platform = get_default_platform()
 
     # Validate platform
-    if platform not in list_platforms():
+    if platform not in list_platform_set():
         return {
             "success": False,
             "error": f"Unknown platform: {platform}. Available: {', '.join(list_platforms())}",
@@ -42,27 +43,27 @@ def post_update(
             "error": f"Platform '{platform}' is not configured. Use the configure tool first.",
         }
 
-    # Get platform instance and authenticate
+    # Get platform instance and authenticate. Network calls run in a worker thread
+    # so other requests on the event loop aren't blocked while we wait on the platform.
     platform_instance = get_platform(platform)
 
-    if not platform_instance.authenticate(credentials):
+    if not await asyncio.to_thread(platform_instance.authenticate, credentials):
         return {
             "success": False,
             "error": "Authentication failed. Please reconfigure your credentials.",
         }
 
     # Post the content
-    result = platform_instance.post(content)
+    result = await asyncio.to_thread(platform_instance.post, content)
 
     # Save to history if successful
     if result["success"]:
-        add_post_to_history(
-            {
-                "platform": platform,
-                "content": content,
-                "url": result["url"],
-                "posted_at": datetime.now().isoformat(),
-            }
-        )
+        entry = {
+            "platform": platform,
+            "content": content,
+            "url": result["url"],
+            "posted_at": datetime.now().isoformat(),
+        }
+        await asyncio.to_thread(add_post_to_history, entry)
 
     return result
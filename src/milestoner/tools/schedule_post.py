@@ -1,22 +1,174 @@
 """Scheduled post management."""
 
+import time
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime
 from typing import Any
 
-from ..config.store import CONFIG_DIR, _ensure_config_dir, _read_json, _write_json
-from ..platforms.registry import get_platform, list_platforms
+from ..config.store import (
+    CONFIG_DIR,
+    _append_jsonl,
+    _copy_json,
+    _file_version,
+    _read_json,
+    _read_jsonl,
+    _write_json,
+    get_default_platform,
+)
+from ..platforms.registry import get_platform, list_platform_set, list_platforms
 from ..scheduling import get_optimal_times
 
 SCHEDULED_POSTS_FILE = CONFIG_DIR / "scheduled-posts.json"
+SCHEDULED_POSTS_LOG = CONFIG_DIR / "scheduled-posts.log"
+
+# Fold the change log into the snapshot file once it has this many entries
+_COMPACT_AFTER = 100
+
+# Snapshot with the log replayed on top, tagged with the versions of both files
+# and the number of log entries
+_replayed: tuple[Any, dict[str, dict[str, Any]], int] | None = None
+
+
+def _schedule_key(post: dict[str, Any]) -> int:
+    """Sort key for scheduled posts: the scheduled time in epoch milliseconds."""
+    return post["scheduled_for_ts"]
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO datetime string, accepting a trailing Z for UTC."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _timestamp_ms(when: datetime) -> int:
+    """Convert a datetime to epoch milliseconds."""
+    return int(when.timestamp() * 1000)
+
+
+def _ensure_timestamp(post: dict[str, Any]) -> bool:
+    """Fill in scheduled_for_ts on posts saved before it existed. Returns True if it was added."""
+    if "scheduled_for_ts" in post:
+        return False
+    post["scheduled_for_ts"] = _timestamp_ms(_parse_iso(post["scheduled_for"]))
+    return True
+
+
+def _load_scheduled() -> dict[str, dict[str, Any]]:
+    """
+    Load scheduled posts keyed by ID, in scheduled-time order.
+
+    Posts are stored as a snapshot file plus an append-only log of changes
+    since the snapshot. The replayed result is cached until either file changes.
+    """
+    posts_by_id, _ = _load_state()
+    return _copy_json(posts_by_id)
+
+
+def _load_state() -> tuple[dict[str, dict[str, Any]], int]:
+    """Get the cached replayed posts (not to be mutated) and the log length."""
+    global _replayed
+
+    version = (_file_version(SCHEDULED_POSTS_FILE), _file_version(SCHEDULED_POSTS_LOG))
+    if _replayed is None or _replayed[0] != version:
+        posts_by_id = _read_snapshot()
+        entries = _read_jsonl(SCHEDULED_POSTS_LOG)
+        for entry in entries:
+            _apply_entry(posts_by_id, entry)
+        if any(entry["op"] == "add" for entry in entries):
+            posts_by_id = dict(sorted(posts_by_id.items(), key=lambda item: _schedule_key(item[1])))
+        _replayed = (version, posts_by_id, len(entries))
+
+    return _replayed[1], _replayed[2]
+
+
+def _read_snapshot() -> dict[str, dict[str, Any]]:
+    """Read the snapshot file."""
+    data = _read_json(SCHEDULED_POSTS_FILE)
+    if "posts_by_id" in data:
+        posts = list(data["posts_by_id"].values())
+        # Snapshots are written in order unless they predate scheduled_for_ts
+        added = [p for p in posts if _ensure_timestamp(p)]
+        if not added:
+            return data["posts_by_id"]
+    else:
+        # Older files store a plain list of posts
+        posts = data.get("posts", [])
+        for post in posts:
+            _ensure_timestamp(post)
+
+    posts.sort(key=_schedule_key)
+    return {p["id"]: p for p in posts}
+
+
+def _apply_entry(posts_by_id: dict[str, dict[str, Any]], entry: dict[str, Any]) -> None:
+    """Apply one change log entry."""
+    if entry["op"] == "add":
+        _ensure_timestamp(entry["post"])
+        posts_by_id[entry["post"]["id"]] = entry["post"]
+    elif entry["op"] == "update":
+        post = posts_by_id.get(entry["id"])
+        if post is not None:
+            post.update(entry["fields"])
+
+
+def _record(entry: dict[str, Any]) -> None:
+    """Append a change to the log, compacting it into the snapshot when it gets long."""
+    global _replayed
+
+    posts_by_id, log_length = _load_state()
+    log_before = _file_version(SCHEDULED_POSTS_LOG)
+    written = _append_jsonl(SCHEDULED_POSTS_LOG, [entry])
+    log_after = _file_version(SCHEDULED_POSTS_LOG)
+
+    # If the log grew by exactly our entry, nobody else wrote to it in between, so
+    # apply the entry to the cached state instead of replaying the whole log
+    size_before = log_before[1] if log_before else 0
+    if log_after is None or log_after[1] != size_before + written:
+        _replayed = None
+        posts_by_id, log_length = _load_state()
+    else:
+        entry = _copy_json(entry)
+        _apply_entry(posts_by_id, entry)
+        if entry["op"] == "add":
+            posts_by_id = _insert_in_order(posts_by_id, entry["post"])
+        log_length += 1
+        _replayed = ((_file_version(SCHEDULED_POSTS_FILE), log_after), posts_by_id, log_length)
+
+    if log_length >= _COMPACT_AFTER:
+        _write_json(SCHEDULED_POSTS_FILE, {"posts_by_id": posts_by_id})
+        # Replaying the log again is harmless, so a crash before this unlink is safe
+        SCHEDULED_POSTS_LOG.unlink(missing_ok=True)
+        _replayed = ((_file_version(SCHEDULED_POSTS_FILE), None), posts_by_id, 0)
+
+
+def _insert_in_order(
+    posts_by_id: dict[str, dict[str, Any]], post: dict[str, Any]
+) -> dict[str, dict[str, Any]]:
+    """Move a just-added post into scheduled-time order."""
+    posts = list(posts_by_id.values())
+    if len(posts) < 2 or _schedule_key(posts[-2]) <= _schedule_key(post):
+        # Added at the end, which is already in order
+        return posts_by_id
+    posts.pop()
+    insort(posts, post, key=_schedule_key)
+    return {p["id"]: p for p in posts}
 
 
 def get_scheduled_posts() -> list[dict[str, Any]]:
     """Get all scheduled posts."""
-    data = _read_json(SCHEDULED_POSTS_FILE)
-    posts = data.get("posts", [])
-    # Filter out past posts that weren't posted
-    now = datetime.now().isoformat()
-    return [p for p in posts if p.get("scheduled_for", "") >= now or p.get("status") == "posted"]
+    posts = list(_load_scheduled().values())
+    # Filter out past posts that weren't posted; everything from the cut-point on is upcoming
+    now_ms = int(time.time() * 1000)
+    cut = bisect_left(posts, now_ms, key=_schedule_key)
+    return [p for p in posts[:cut] if p.get("status") == "posted"] + posts[cut:]
+
+
+def get_pending_posts() -> list[dict[str, Any]]:
+    """Get upcoming posts that are still scheduled, in a single pass."""
+    posts_by_id, _ = _load_state()
+    posts = list(posts_by_id.values())
+    cut = bisect_left(posts, int(time.time() * 1000), key=_schedule_key)
+    # Only copy the posts we return; the cached state must not be mutated
+    return [_copy_json(p) for p in posts[cut:] if p.get("status") == "scheduled"]
 
 
 def schedule_post(
@@ -39,12 +191,10 @@ def schedule_post(
     """
     # Determine platform
     if platform is None:
-        from ..config.store import get_default_platform
-
         platform = get_default_platform()
 
     # Validate platform
-    if platform not in list_platforms():
+    if platform not in list_platform_set():
         return {
             "success": False,
             "error": f"Unknown platform: {platform}. Available: {', '.join(list_platforms())}",
@@ -63,15 +213,16 @@ def schedule_post(
         optimal = get_optimal_times()
         if optimal["recommendations"]:
             scheduled_for = optimal["recommendations"][0]["datetime"]
+            scheduled_at = _parse_iso(scheduled_for)
         else:
             return {
                 "success": False,
                 "error": "No optimal times available. Please specify a time.",
             }
     else:
-        # Validate the provided datetime
+        # Validate the provided datetime, keeping the parsed value for its timestamp
         try:
-            datetime.fromisoformat(scheduled_for.replace("Z", "+00:00"))
+            scheduled_at = _parse_iso(scheduled_for)
         except ValueError:
             return {
                 "success": False,
@@ -85,17 +236,13 @@ def schedule_post(
         "content": content,
         "platform": platform,
         "scheduled_for": scheduled_for,
+        "scheduled_for_ts": _timestamp_ms(scheduled_at),
         "created_at": datetime.now().isoformat(),
         "status": "scheduled",
     }
 
     # Save to file
-    _ensure_config_dir()
-    data = _read_json(SCHEDULED_POSTS_FILE)
-    if "posts" not in data:
-        data["posts"] = []
-    data["posts"].append(scheduled_post)
-    _write_json(SCHEDULED_POSTS_FILE, data)
+    _record({"op": "add", "post": scheduled_post})
 
     return {
         "success": True,
@@ -106,8 +253,7 @@ def schedule_post(
 
 def list_scheduled_posts() -> dict[str, Any]:
     """List all pending scheduled posts."""
-    posts = get_scheduled_posts()
-    pending = [p for p in posts if p.get("status") == "scheduled"]
+    pending = get_pending_posts()
     optimal = get_optimal_times()
 
     return {
@@ -119,43 +265,30 @@ def list_scheduled_posts() -> dict[str, Any]:
 
 def cancel_scheduled_post(post_id: str) -> dict[str, Any]:
     """Cancel a scheduled post."""
-    data = _read_json(SCHEDULED_POSTS_FILE)
-    posts = data.get("posts", [])
+    posts_by_id, _ = _load_state()
+    if post_id not in posts_by_id:
+        return {"success": False, "error": f"Post {post_id} not found"}
 
-    for post in posts:
-        if post.get("id") == post_id:
-            post["status"] = "cancelled"
-            _write_json(SCHEDULED_POSTS_FILE, data)
-            return {"success": True, "message": f"Post {post_id} cancelled"}
-
-    return {"success": False, "error": f"Post {post_id} not found"}
+    _record({"op": "update", "id": post_id, "fields": {"status": "cancelled"}})
+    return {"success": True, "message": f"Post {post_id} cancelled"}
 
 
 def get_due_posts() -> list[dict[str, Any]]:
     """Get posts that are due to be posted now."""
-    data = _read_json(SCHEDULED_POSTS_FILE)
-    posts = data.get("posts", [])
-    now = datetime.now().isoformat()
-
-    due = []
-    for post in posts:
-        if post.get("status") == "scheduled" and post.get("scheduled_for", "") <= now:
-            due.append(post)
+    posts = list(_load_scheduled().values())
+    now_ms = int(time.time() * 1000)
 
-    return due
+    # Only posts before the cut-point can be due
+    cut = bisect_right(posts, now_ms, key=_schedule_key)
+    return [p for p in posts[:cut] if p.get("status") == "scheduled"]
 
 
 def mark_post_as_posted(post_id: str, url: str) -> dict[str, Any]:
     """Mark a scheduled post as posted."""
-    data = _read_json(SCHEDULED_POSTS_FILE)
-    posts = data.get("posts", [])
-
-    for post in posts:
-        if post.get("id") == post_id:
-            post["status"] = "posted"
-            post["posted_at"] = datetime.now().isoformat()
-            post["url"] = url
-            _write_json(SCHEDULED_POSTS_FILE, data)
-            return {"success": True}
+    posts_by_id, _ = _load_state()
+    if post_id not in posts_by_id:
+        return {"success": False, "error": f"Post {post_id} not found"}
 
-    return {"success": False, "error": f"Post {post_id} not found"}
+    fields = {"status": "posted", "posted_at": datetime.now().isoformat(), "url": url}
+    _record({"op": "update", "id": post_id, "fields": fields})
+    return {"success": True}
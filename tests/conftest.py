@@ -0,0 +1,51 @@
+import subprocess
+
+import pytest
+
+from milestoner import server
+from milestoner.config import store
+from milestoner.git.history import clear_repo_cache
+from milestoner.tools import schedule_post
+
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path, monkeypatch):
+    config_dir = tmp_path / ".milestoner"
+    monkeypatch.setattr(store, "CONFIG_DIR", config_dir)
+    monkeypatch.setattr(store, "CONFIG_FILE", config_dir / "config.json")
+    monkeypatch.setattr(store, "POST_HISTORY_FILE", config_dir / "post-history.jsonl")
+    monkeypatch.setattr(store, "LEGACY_POST_HISTORY_FILE", config_dir / "post-history.json")
+    monkeypatch.setattr(schedule_post, "SCHEDULED_POSTS_FILE", config_dir / "scheduled-posts.json")
+    monkeypatch.setattr(schedule_post, "SCHEDULED_POSTS_LOG", config_dir / "scheduled-posts.log")
+    monkeypatch.setattr(schedule_post, "_replayed", None)
+    # server.py imports the paths it versions resources on by name
+    monkeypatch.setattr(server, "CONFIG_FILE", config_dir / "config.json")
+    monkeypatch.setattr(server, "POST_HISTORY_FILE", config_dir / "post-history.jsonl")
+    monkeypatch.setattr(server, "LEGACY_POST_HISTORY_FILE", config_dir / "post-history.json")
+    monkeypatch.setattr(server, "_resource_cache", {})
+    store._CACHE.clear()
+    return config_dir
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "repo"
+    path.mkdir()
+
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+            cwd=path,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q")
+    (path / "a.txt").write_text("one\n")
+    git("add", "a.txt")
+    git("commit", "-q", "-m", "first")
+    (path / "a.txt").write_text("one\ntwo\n")
+    git("commit", "-q", "-am", "second")
+
+    yield path
+    clear_repo_cache()
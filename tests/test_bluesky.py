@@ -0,0 +1,84 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from atproto.exceptions import AtProtocolError
+
+from milestoner.platforms import bluesky
+from milestoner.platforms.bluesky import BlueskyPlatform
+
+APP_PASSWORD = "abcd-efgh-ijkl-mnop"
+
+
+class FakeClient:
+    logins: list[tuple[str, str]] = []
+
+    def login(self, login, password):
+        self.logins.append((login, password))
+
+
+@pytest.fixture
+def logins(monkeypatch):
+    monkeypatch.setattr(bluesky, "Client", FakeClient)
+    FakeClient.logins = []
+    return FakeClient.logins
+
+
+@pytest.mark.parametrize(
+    ("handle", "login"),
+    [
+        ("alice.bsky.social", "alice.bsky.social"),
+        ("@alice.bsky.social", "alice.bsky.social"),
+        ("alice@example.com", "alice@example.com"),
+        ("did:plc:abc123", "did:plc:abc123"),
+    ],
+)
+def test_authenticate_accepts_login_identifiers(logins, handle, login):
+    platform = BlueskyPlatform()
+    assert platform.authenticate({"handle": handle, "app_password": APP_PASSWORD})
+    assert logins == [(login, APP_PASSWORD)]
+
+
+@pytest.mark.parametrize(
+    "credentials",
+    [
+        {"handle": "not a handle", "app_password": APP_PASSWORD},
+        {"handle": "alice.bsky.social", "app_password": "short"},
+    ],
+)
+def test_authenticate_rejects_malformed_credentials_without_login(logins, credentials):
+    assert not BlueskyPlatform().authenticate(credentials)
+    assert logins == []
+
+
+def test_login_waits_for_a_post_in_progress(monkeypatch):
+    events: list[str] = []
+    sending = threading.Event()
+
+    class SlowClient:
+        def login(self, login, password):
+            events.append(f"login {login}")
+            if login == "bad.bsky.social":
+                raise AtProtocolError("bad credentials")
+
+        def send_post(self, text, facets=None):
+            sending.set()
+            time.sleep(0.1)
+            events.append("sent")
+            return SimpleNamespace(uri="at://did:plc:abc/app.bsky.feed.post/rkey")
+
+    monkeypatch.setattr(bluesky, "Client", SlowClient)
+    platform = BlueskyPlatform()
+    assert platform.authenticate({"handle": "alice.bsky.social", "app_password": APP_PASSWORD})
+
+    results = {}
+    poster = threading.Thread(target=lambda: results.update(post=platform.post("hello")))
+    poster.start()
+    sending.wait()
+    # A failed login resets the client; it must not happen mid-send
+    assert not platform.authenticate({"handle": "bad.bsky.social", "app_password": APP_PASSWORD})
+    poster.join()
+
+    assert results["post"]["success"]
+    assert events == ["login alice.bsky.social", "sent", "login bad.bsky.social"]
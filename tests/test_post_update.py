@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from milestoner.config import store
+from milestoner.platforms import registry
+from milestoner.tools.post_update import post_update
+
+
+class FakePlatform:
+    def authenticate(self, credentials):
+        return True
+
+    def post(self, content):
+        return {"success": True, "url": "https://example.com/post/1"}
+
+
+@pytest.fixture
+def fake_bluesky(monkeypatch):
+    store.save_platform_credentials("bluesky", {"handle": "a.bsky.social", "app_password": "x"})
+    monkeypatch.setitem(registry._INSTANCES, "bluesky", FakePlatform())
+
+
+def test_post_is_in_history_when_post_update_returns(fake_bluesky):
+    result = asyncio.run(post_update("hello", platform="bluesky"))
+
+    assert result["success"]
+    assert [p["content"] for p in store.get_post_history()] == ["hello"]
+
+
+def test_history_write_errors_propagate(fake_bluesky, monkeypatch):
+    def fail(post):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("milestoner.tools.post_update.add_post_to_history", fail)
+    with pytest.raises(OSError):
+        asyncio.run(post_update("hello", platform="bluesky"))
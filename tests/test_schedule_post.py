@@ -0,0 +1,105 @@
+from datetime import UTC, datetime, timedelta
+
+import orjson
+import pytest
+
+from milestoner.tools import schedule_post as sp
+
+
+def _at(**delta) -> str:
+    return (datetime.now() + timedelta(**delta)).isoformat()
+
+
+def _contents(posts):
+    return [p["content"] for p in posts]
+
+
+def _reload():
+    """Drop the in-process cache so state is rebuilt from the files."""
+    sp._replayed = None
+
+
+def test_migrates_legacy_list_format(config_dir):
+    config_dir.mkdir()
+    legacy = [
+        {
+            "id": "b",
+            "content": "B",
+            "scheduled_for": "2099-01-01T10:00:00+00:00",
+            "status": "scheduled",
+        },
+        {
+            "id": "a",
+            "content": "A",
+            "scheduled_for": "2099-01-01T09:00:00-05:00",
+            "status": "scheduled",
+        },
+        {"id": "c", "content": "C", "scheduled_for": "2000-01-01T00:00:00Z", "status": "scheduled"},
+    ]
+    sp.SCHEDULED_POSTS_FILE.write_bytes(orjson.dumps({"posts": legacy}))
+
+    # 10:00 UTC comes before 09:00-05:00 (14:00 UTC); ordering is by instant, not text
+    assert _contents(sp.get_scheduled_posts()) == ["B", "A"]
+    assert _contents(sp.get_due_posts()) == ["C"]
+    assert all("scheduled_for_ts" in p for p in sp.get_scheduled_posts())
+
+    sp.cancel_scheduled_post("a")
+    assert _contents(sp.get_pending_posts()) == ["B"]
+
+
+def test_due_and_pending_cut_points():
+    utc_past = (datetime.now(UTC) - timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    utc_future = (datetime.now(UTC) + timedelta(hours=3)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    sp.schedule_post("later", scheduled_for=_at(days=1), platform="bluesky")
+    sp.schedule_post("past", scheduled_for=_at(hours=-1), platform="bluesky")
+    sp.schedule_post("past-utc", scheduled_for=utc_past, platform="bluesky")
+    sp.schedule_post("soon-utc", scheduled_for=utc_future, platform="bluesky")
+
+    assert _contents(sp.get_due_posts()) == ["past", "past-utc"]
+    assert _contents(sp.get_pending_posts()) == ["soon-utc", "later"]
+    assert _contents(sp.list_scheduled_posts()["pending_posts"]) == ["soon-utc", "later"]
+
+
+def test_cancel_and_mark_are_replayed_from_log():
+    later = sp.schedule_post("later", scheduled_for=_at(days=1), platform="bluesky")["post"]
+    due = sp.schedule_post("due", scheduled_for=_at(hours=-1), platform="bluesky")["post"]
+
+    assert sp.cancel_scheduled_post(later["id"])["success"]
+    assert sp.mark_post_as_posted(due["id"], "https://example.com/1")["success"]
+    assert not sp.cancel_scheduled_post("missing")["success"]
+    cached = sp.get_scheduled_posts()
+
+    _reload()
+    assert sp.get_scheduled_posts() == cached
+    assert [(p["content"], p["status"]) for p in cached] == [
+        ("due", "posted"),
+        ("later", "cancelled"),
+    ]
+    assert cached[0]["url"] == "https://example.com/1"
+    assert not sp.SCHEDULED_POSTS_FILE.exists()
+
+
+def test_compaction_then_reload_from_snapshot(monkeypatch):
+    monkeypatch.setattr(sp, "_COMPACT_AFTER", 5)
+    ids = [
+        sp.schedule_post(f"p{i}", scheduled_for=_at(hours=4 - i), platform="bluesky")["post"]["id"]
+        for i in range(4)
+    ]
+    assert sp.SCHEDULED_POSTS_LOG.exists()
+
+    # The fifth entry triggers compaction into the snapshot
+    sp.cancel_scheduled_post(ids[0])
+    assert not sp.SCHEDULED_POSTS_LOG.exists()
+    assert sp.SCHEDULED_POSTS_FILE.exists()
+    cached = sp.get_scheduled_posts()
+
+    _reload()
+    assert sp.get_scheduled_posts() == cached
+    assert _contents(sp.get_pending_posts()) == ["p3", "p2", "p1"]
+
+
+@pytest.mark.parametrize("value", ["tomorrow", "2099-13-01T00:00:00"])
+def test_rejects_invalid_datetimes(value):
+    result = sp.schedule_post("x", scheduled_for=value, platform="bluesky")
+    assert not result["success"]
+    assert not sp.SCHEDULED_POSTS_LOG.exists()
@@ -0,0 +1,36 @@
+import asyncio
+
+import orjson
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from milestoner import server
+from milestoner.config import store
+
+
+async def _read_resources(*uris: str) -> list[str]:
+    async with create_connected_server_and_client_session(server._init_server()) as client:
+        return [(await client.read_resource(uri)).contents[0].text for uri in uris]
+
+
+def test_read_resources_through_mcp():
+    store.add_posts_to_history([{"content": "first"}])
+    config, posts = asyncio.run(_read_resources("milestoner://config", "milestoner://recent-posts"))
+
+    assert orjson.loads(config)["default_platform"] == "bluesky"
+    assert orjson.loads(posts) == {"posts": [{"content": "first"}]}
+
+
+def test_recent_posts_cache_follows_history_file():
+    store.add_posts_to_history([{"content": "first"}])
+    first, again = asyncio.run(_read_resources(*["milestoner://recent-posts"] * 2))
+    assert first == again
+    assert "milestoner://recent-posts" in server._resource_cache
+
+    store.add_posts_to_history([{"content": "second"}])
+    (updated,) = asyncio.run(_read_resources("milestoner://recent-posts"))
+    assert [p["content"] for p in orjson.loads(updated)["posts"]] == ["first", "second"]
+
+
+def test_unknown_resource():
+    (text,) = asyncio.run(_read_resources("milestoner://nope"))
+    assert orjson.loads(text) == {"error": "Unknown resource: milestoner://nope"}
@@ -0,0 +1,56 @@
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import pytest
+
+from milestoner.config import store
+
+
+def test_post_history_json_round_trips_unicode_line_separators():
+    posts = [
+        {"content": "line one\u2028line two \x85 nel\u2029end", "url": "u1"},
+        {"content": "plain", "url": "u2"},
+    ]
+    store.add_posts_to_history(posts)
+
+    assert store.get_post_history() == posts
+    assert orjson.loads(store.get_post_history_json()) == posts
+
+
+def test_post_history_json_empty():
+    assert store.get_post_history_json() == "[]"
+
+
+def test_concurrent_atomic_writes_do_not_collide(config_dir):
+    config_dir.mkdir()
+    target = config_dir / "config.json"
+    payloads = [orjson.dumps({"writer": i, "pad": "x" * 10_000}) for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda data: store._write_atomic(target, data), payloads * 5))
+
+    assert target.read_bytes() in payloads
+    assert [p.name for p in config_dir.iterdir()] == ["config.json"]
+    assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+
+def test_atomic_write_removes_temp_file_on_error(config_dir, monkeypatch):
+    config_dir.mkdir()
+
+    def fail(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(store.os, "replace", fail)
+    with pytest.raises(OSError):
+        store._write_atomic(config_dir / "config.json", b"{}")
+    assert list(config_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("1", True), ("true", True), ("Yes", True), ("0", False), ("false", False), ("", False)],
+)
+def test_env_flag(monkeypatch, value, expected):
+    monkeypatch.setenv("MILESTONER_TEST_FLAG", value)
+    assert store._env_flag("MILESTONER_TEST_FLAG") is expected